@@ -1,16 +1,73 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+import matplotlib as mpl
+import matplotlib.style
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import ttk, messagebox
-import seaborn as sns
+import traceback
 from matplotlib.gridspec import GridSpec
+from types import SimpleNamespace
 
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional: sin él se usa la versión NumPy
+    njit = None
+
+
+mpl.style.use('default')
+# Paleta "husl" de seaborn (6 colores) sin importar seaborn ni pyplot
+mpl.rcParams['axes.prop_cycle'] = mpl.cycler(
+    color=['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4'])
+
+
+def _kinetic_kernel_loop(time, initial_conc, ka, ke, mu_max, Ki, K_max, N0,
+                         out_conc, out_mu, out_log_biomass):
+    """Núcleo cinético fusionado: un único recorrido de la malla de tiempo"""
+    # log10 de la logística en forma cerrada:
+    #   log10(N) = log10(K_max) - log10(1 + (K_max/N0 - 1)·e^(-μt))
+    # evita calcular N (hasta 1e9) para luego tomar su logaritmo
+    ln10 = np.log(10.0)
+    log10_K = np.log10(K_max)
+    log10_N0 = np.log10(N0)
+    growth_ratio = K_max / N0 - 1.0
+    
+    k_total = ka + ke
+    for i in range(time.size):
+        conc = initial_conc * np.exp(-k_total * time[i])
+        mu = mu_max / (1.0 + conc / Ki)
+        if mu > 0:
+            log_biomass = log10_K - np.log1p(growth_ratio * np.exp(-mu * time[i])) / ln10
+        else:
+            log_biomass = log10_N0 - 0.1 * time[i] / ln10
+        
+        out_conc[i] = conc
+        out_mu[i] = mu
+        out_log_biomass[i] = log_biomass
+
+
+def _kinetic_kernel_numpy(time, initial_conc, ka, ke, mu_max, Ki, K_max, N0,
+                          out_conc, out_mu, out_log_biomass):
+    """Núcleo cinético vectorizado, usado cuando Numba no está disponible"""
+    np.multiply(-(ka + ke), time, out=out_conc)
+    np.exp(out_conc, out=out_conc)
+    out_conc *= initial_conc
+    
+    np.divide(out_conc, Ki, out=out_mu)
+    out_mu += 1.0
+    np.divide(mu_max, out_mu, out=out_mu)
+    
+    ln10 = np.log(10.0)
+    logistic = np.log10(K_max) - np.log1p((K_max / N0 - 1.0) * np.exp(-out_mu * time)) / ln10
+    decay = np.log10(N0) - 0.1 * time / ln10
+    np.copyto(out_log_biomass, np.where(out_mu > 0, logistic, decay))
+
+
+if njit is not None:
+    _kinetic_kernel = njit(cache=True, fastmath=True)(_kinetic_kernel_loop)
+else:
+    _kinetic_kernel = _kinetic_kernel_numpy
 
-plt.style.use('default')  
-sns.set_palette("husl")
 
 class InteractiveKineticModel:
     def __init__(self):
@@ -36,22 +93,67 @@ class InteractiveKineticModel:
         
         # Datos experimentales
         self.experimental_data = {
-            'compound1': pd.DataFrame([
+            'compound1': [
                 {'conc': 0.00, 'mu': 0.95, 'g': 0.73, 'viable': 1.0},
                 {'conc': 0.05, 'mu': 0.85, 'g': 0.82, 'viable': 0.89},
                 {'conc': 0.10, 'mu': 0.75, 'g': 0.92, 'viable': 0.79},
                 {'conc': 0.15, 'mu': 0.55, 'g': 1.26, 'viable': 0.58},
                 {'conc': 0.20, 'mu': 0.40, 'g': 1.73, 'viable': 0.42}
-            ]),
-            'compound2': pd.DataFrame([
+            ],
+            'compound2': [
                 {'conc': 0.00, 'mu': 0.95, 'g': 0.73, 'viable': 1.0},
                 {'conc': 0.05, 'mu': 0.90, 'g': 0.77, 'viable': 0.95},
                 {'conc': 0.10, 'mu': 0.91, 'g': 0.76, 'viable': 0.96},
                 {'conc': 0.15, 'mu': 0.89, 'g': 0.78, 'viable': 0.94},
                 {'conc': 0.20, 'mu': 0.90, 'g': 0.77, 'viable': 0.95}
-            ])
+            ]
+        }
+        
+        # Concentración y μ experimentales como arreglos NumPy, listos para graficar
+        self._exp = {
+            compound: (np.array([row['conc'] for row in rows]),
+                       np.array([row['mu'] for row in rows]))
+            for compound, rows in self.experimental_data.items()
+        }
+        
+        # Rango de concentraciones para las curvas teóricas (constante)
+        self._conc_range = np.linspace(0, 0.25, 100)
+        
+        # Gráficos con cambios pendientes, en el orden de las pestañas
+        self._tab_keys = ['inh', 'kin', 'cmp']
+        self._dirty = {key: True for key in self._tab_keys}
+        self._redraw_pending = False
+        
+        # Durante el arrastre de un control los límites de los ejes sólo
+        # crecen; los gráficos dibujados así se reajustan al soltar
+        self._dragging = False
+        self._drag_plots = set()
+        
+        # Gráficos que dependen de cada parámetro
+        self._plot_dependencies = {
+            'mu_max': ('inh', 'kin', 'cmp'),
+            'Ki_comp1': ('inh', 'kin', 'cmp'),
+            'Ki_comp2': ('inh', 'kin', 'cmp'),
+            'K_max': ('kin',),
+            'ka': ('kin',),
+            'ke': ('kin',),
+            'initial_conc': ('kin',),
+            'time_points': ('kin',)
         }
         
+        # Últimos valores vistos: los eventos que no cambian ningún valor
+        # (p. ej. arrastrar time_points sin cambiar de entero) se ignoran
+        self._last_values = self.get_parameter_values()
+        self._last_compound = self.selected_compound.get()
+        
+        # Malla de tiempo y búferes de salida del núcleo cinético, reutilizados
+        # mientras no cambie el número de puntos. La primera llamada compila
+        # el núcleo antes de la primera interacción
+        self._time_grid_points = None
+        self._time_grid = None
+        self._kinetic_buffers = None
+        self.calculate_kinetic_data(self.get_parameter_values())
+        
         self.setup_ui()
         self.bind_events()
         self.update_plots()
@@ -117,6 +219,11 @@ class InteractiveKineticModel:
                        font=("Arial", 10),
                        foreground="#2c3e50")
         
+        # Estilo para la barra de estado
+        style.configure("Status.TLabel",
+                       font=("Arial", 10),
+                       foreground="#c0392b")
+        
     def setup_control_panel(self, parent):
         """Configurar panel de controles"""
         control_frame = ttk.LabelFrame(parent, text="Parámetros del Modelo", padding=10)
@@ -187,17 +294,17 @@ class InteractiveKineticModel:
         
         ttk.Label(frame, text=label, style="Param.TLabel").pack(side="left")
         
-        if is_int:
-            scale = ttk.Scale(frame, from_=min_val, to=max_val, 
-                            variable=variable, orient="horizontal",
-                            command=lambda x: self.on_parameter_change())
-        else:
-            scale = ttk.Scale(frame, from_=min_val, to=max_val, 
-                            variable=variable, orient="horizontal",
-                            command=lambda x: self.on_parameter_change())
+        # Los cambios de la variable ya llegan a on_parameter_change por la
+        # traza de bind_events; un command= aquí duplicaría cada evento
+        scale = ttk.Scale(frame, from_=min_val, to=max_val, 
+                        variable=variable, orient="horizontal")
         
         scale.pack(side="left", fill="x", expand=True, padx=5)
         
+        # Mientras se arrastra sólo se redibuja por blitting
+        scale.bind("<ButtonPress-1>", lambda event: self.on_drag_start())
+        scale.bind("<ButtonRelease-1>", lambda event: self.on_drag_end())
+        
         value_label = ttk.Label(frame, text=f"{variable.get():.3f}")
         value_label.pack(side="right")
         
@@ -236,124 +343,48 @@ class InteractiveKineticModel:
     def setup_plots(self):
         """Configurar las figuras de matplotlib"""
         # Figura para curvas de inhibición
-        self.fig_inhibition = Figure(figsize=(10, 6), dpi=100)
+        self.fig_inhibition = Figure(figsize=(10, 6), dpi=100, constrained_layout=True)
         self.canvas_inhibition = FigureCanvasTkAgg(self.fig_inhibition, self.inhibition_frame)
         self.canvas_inhibition.get_tk_widget().pack(fill="both", expand=True)
         
         # Figura para cinética integrada
-        self.fig_kinetic = Figure(figsize=(10, 8), dpi=100)
+        self.fig_kinetic = Figure(figsize=(10, 8), dpi=100, constrained_layout=True)
         self.canvas_kinetic = FigureCanvasTkAgg(self.fig_kinetic, self.kinetic_frame)
         self.canvas_kinetic.get_tk_widget().pack(fill="both", expand=True)
         
         # Figura para comparación
-        self.fig_comparison = Figure(figsize=(10, 6), dpi=100)
+        self.fig_comparison = Figure(figsize=(10, 6), dpi=100, constrained_layout=True)
         self.canvas_comparison = FigureCanvasTkAgg(self.fig_comparison, self.comparison_frame)
         self.canvas_comparison.get_tk_widget().pack(fill="both", expand=True)
         
-    def setup_results_panel(self, parent):
-        """Configurar panel de resultados"""
-        results_frame = ttk.LabelFrame(parent, text="Resultados y Análisis", padding=10)
-        results_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(10, 0))
-        
-        # Frame para resultados numéricos
-        numeric_frame = ttk.Frame(results_frame)
-        numeric_frame.pack(fill="x")
-        
-        # Variables para mostrar resultados
-        self.results_vars = {
-            'ed50_comp1': tk.StringVar(),
-            'ed50_comp2': tk.StringVar(),
-            'potencia_rel': tk.StringVar(),
-            'ki_ratio': tk.StringVar()
-        }
-        
-        # Crear etiquetas para resultados
-        for i, (key, var) in enumerate(self.results_vars.items()):
-            ttk.Label(numeric_frame, textvariable=var, 
-                     style="Param.TLabel").grid(row=0, column=i, padx=10, sticky="w")
-        
-    def inhibition_model(self, concentration, mu_max, Ki):
-        """Modelo de inhibición competitiva"""
-        return mu_max / (1 + concentration / Ki)
-    
-    def pharmacokinetic_model(self, time, initial_conc, ka, ke):
-        """Modelo farmacocinético"""
-        k_total = ka + ke
-        return initial_conc * np.exp(-k_total * time)
-    
-    def population_growth_model(self, time, mu, K_max, N0=1e6):
-        """Modelo de crecimiento poblacional"""
-        if mu <= 0:
-            return N0 * np.exp(-0.1 * time)
+        # Los ejes y artistas se crean una sola vez; las actualizaciones sólo
+        # cambian sus datos y se redibujan por blitting
+        self.setup_inhibition_axes()
+        self.setup_kinetic_axes()
+        self.setup_comparison_axes()
         
-        biomass = (K_max * N0) / (N0 + (K_max - N0) * np.exp(-mu * time))
-        return biomass
-    
-    def calculate_kinetic_data(self):
-        """Calcular datos cinéticos integrados"""
-        dt = 8 / self.parameters['time_points'].get()
-        time_array = np.arange(0, 8 + dt, dt)
-        
-        results = []
-        for time in time_array:
-            current_conc = self.pharmacokinetic_model(
-                time, 
-                self.parameters['initial_conc'].get(),
-                self.parameters['ka'].get(),
-                self.parameters['ke'].get()
-            )
-            
-            # Usar Ki según el compuesto seleccionado
-            ki_value = (self.parameters['Ki_comp1'].get() if 
-                       self.selected_compound.get() == "compound1" else 
-                       self.parameters['Ki_comp2'].get())
-            
-            current_mu = self.inhibition_model(
-                current_conc,
-                self.parameters['mu_max'].get(),
-                ki_value
-            )
-            
-            biomass = self.population_growth_model(
-                time, current_mu, self.parameters['K_max'].get()
-            )
-            log_biomass = np.log10(biomass)
-            
-            results.append({
-                'time': time,
-                'concentration': current_conc,
-                'mu': current_mu,
-                'biomass': log_biomass,
-                'raw_biomass': biomass
-            })
-        
-        return pd.DataFrame(results)
-    
-    def update_inhibition_plot(self):
-        """Actualizar gráfico de inhibición"""
-        self.fig_inhibition.clear()
-        # CORRECCIÓN: Remover el parámetro figsize
+    def setup_inhibition_axes(self):
+        """Crear ejes y artistas persistentes de las curvas de inhibición"""
         ax1, ax2 = self.fig_inhibition.subplots(1, 2)
+        self.inh_axes = [ax1, ax2]
+        self.inh_lines = []
+        self.inh_texts = []
+        inh_scatters = []
         
         compounds = ['compound1', 'compound2']
         titles = ['Compuesto 1 - Alta Actividad', 'Compuesto 2 - Baja Actividad']
         colors = ['red', 'green']
-        ki_values = [self.parameters['Ki_comp1'].get(), self.parameters['Ki_comp2'].get()]
         
-        for i, (compound, title, color, ki) in enumerate(zip(compounds, titles, colors, ki_values)):
-            ax = ax1 if i == 0 else ax2
-            
+        for ax, compound, title, color in zip(self.inh_axes, compounds, titles, colors):
             # Datos experimentales
-            exp_data = self.experimental_data[compound]
-            ax.scatter(exp_data['conc'], exp_data['mu'], 
-                      color=color, alpha=0.7, s=80, label='Datos Experimentales', zorder=5)
+            exp_conc, exp_mu = self._exp[compound]
+            inh_scatters.append(ax.scatter(exp_conc, exp_mu, 
+                      color=color, alpha=0.7, s=80, label='Datos Experimentales', zorder=5))
             
             # Curva teórica
-            conc_range = np.linspace(0, 0.25, 100)
-            predicted_mu = [self.inhibition_model(conc, self.parameters['mu_max'].get(), ki) 
-                           for conc in conc_range]
-            
-            ax.plot(conc_range, predicted_mu, color='blue', linewidth=2, label='Modelo Ajustado')
+            line, = ax.plot(self._conc_range, np.zeros_like(self._conc_range),
+                            color='blue', linewidth=2, label='Modelo Ajustado')
+            self.inh_lines.append(line)
             
             ax.set_xlabel('Concentración (mmol/L)')
             ax.set_ylabel('μ (h⁻¹)')
@@ -362,25 +393,22 @@ class InteractiveKineticModel:
             ax.grid(True, alpha=0.3)
             
             # Información de parámetros
-            ed50 = ki  # Para inhibición competitiva
-            ax.text(0.05, 0.95, f'Ki: {ki:.3f} mmol/L\nED50: {ed50:.3f} mmol/L',
-                   transform=ax.transAxes, fontsize=9, verticalalignment='top',
-                   bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray", alpha=0.8))
+            text = ax.text(0.05, 0.95, '',
+                           transform=ax.transAxes, fontsize=9, verticalalignment='top',
+                           bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray", alpha=0.8))
+            self.inh_texts.append(text)
         
-        self.fig_inhibition.tight_layout()
-        self.canvas_inhibition.draw()
-    
-    def update_kinetic_plot(self):
-        """Actualizar gráfico de cinética integrada"""
-        kinetic_data = self.calculate_kinetic_data()
+        self.blit_inhibition = self.register_blit(
+            self.canvas_inhibition, self.inh_lines + self.inh_texts + inh_scatters)
         
-        self.fig_kinetic.clear()
-        gs = GridSpec(2, 2, figure=self.fig_kinetic, hspace=0.3, wspace=0.3)
+    def setup_kinetic_axes(self):
+        """Crear ejes y artistas persistentes de la cinética integrada"""
+        # El espaciado entre ejes lo resuelve constrained_layout
+        gs = GridSpec(2, 2, figure=self.fig_kinetic)
         
         # Farmacocinética
         ax1 = self.fig_kinetic.add_subplot(gs[0, 0])
-        ax1.plot(kinetic_data['time'], kinetic_data['concentration'], 
-                'r-', linewidth=2, label='[Inhibidor]')
+        self.kin_conc_line, = ax1.plot([], [], 'r-', linewidth=2, label='[Inhibidor]')
         ax1.set_xlabel('Tiempo (h)')
         ax1.set_ylabel('Concentración (mmol/L)')
         ax1.set_title('Farmacocinética del Inhibidor')
@@ -389,50 +417,42 @@ class InteractiveKineticModel:
         
         # Tasa de crecimiento
         ax2 = self.fig_kinetic.add_subplot(gs[0, 1])
-        ax2.plot(kinetic_data['time'], kinetic_data['mu'], 
-                'b-', linewidth=2, label='μ')
+        self.kin_mu_line, = ax2.plot([], [], 'b-', linewidth=2, label='μ')
         ax2.set_xlabel('Tiempo (h)')
         ax2.set_ylabel('μ (h⁻¹)')
         ax2.set_title('Tasa de Crecimiento Específico')
         ax2.grid(True, alpha=0.3)
         ax2.legend()
         
-        # Crecimiento de biomasa - CORRECCIÓN AQUÍ
+        # Crecimiento de biomasa
         ax3 = self.fig_kinetic.add_subplot(gs[1, :])
-        ax3.plot(kinetic_data['time'], kinetic_data['biomass'], 
-                'g-', linewidth=2, label='Biomasa')
+        self.kin_bio_line, = ax3.plot([], [], 'g-', linewidth=2, label='Biomasa')
         ax3.set_xlabel('Tiempo (h)')
         ax3.set_ylabel('log₁₀(Células/mL)')
         ax3.set_title('Crecimiento de Biomasa')
         ax3.grid(True, alpha=0.3)
         ax3.legend()
         
-        self.canvas_kinetic.draw()
-    
-    def update_comparison_plot(self):
-        """Actualizar gráfico de comparación"""
-        self.fig_comparison.clear()
-        ax = self.fig_comparison.add_subplot(111)
+        self.kin_axes = [ax1, ax2, ax3]
+        self.blit_kinetic = self.register_blit(
+            self.canvas_kinetic, [self.kin_conc_line, self.kin_mu_line, self.kin_bio_line])
         
-        # Comparar ambos compuestos
-        conc_range = np.linspace(0, 0.25, 100)
-        
-        mu_comp1 = [self.inhibition_model(conc, self.parameters['mu_max'].get(), 
-                                         self.parameters['Ki_comp1'].get()) 
-                   for conc in conc_range]
-        
-        mu_comp2 = [self.inhibition_model(conc, self.parameters['mu_max'].get(), 
-                                         self.parameters['Ki_comp2'].get()) 
-                   for conc in conc_range]
+    def setup_comparison_axes(self):
+        """Crear ejes y artistas persistentes del análisis comparativo"""
+        ax = self.fig_comparison.add_subplot(111)
+        self.cmp_ax = ax
         
-        ax.plot(conc_range, mu_comp1, 'r-', linewidth=3, label='Compuesto 1', alpha=0.8)
-        ax.plot(conc_range, mu_comp2, 'g-', linewidth=3, label='Compuesto 2', alpha=0.8)
+        self.cmp_line1, = ax.plot(self._conc_range, np.zeros_like(self._conc_range),
+                                  'r-', linewidth=3, label='Compuesto 1', alpha=0.8)
+        self.cmp_line2, = ax.plot(self._conc_range, np.zeros_like(self._conc_range),
+                                  'g-', linewidth=3, label='Compuesto 2', alpha=0.8)
         
         # Datos experimentales
+        cmp_scatters = []
         for compound, color in [('compound1', 'red'), ('compound2', 'green')]:
-            exp_data = self.experimental_data[compound]
-            ax.scatter(exp_data['conc'], exp_data['mu'], 
-                      color=color, alpha=0.6, s=60, zorder=5)
+            exp_conc, exp_mu = self._exp[compound]
+            cmp_scatters.append(ax.scatter(exp_conc, exp_mu, 
+                      color=color, alpha=0.6, s=60, zorder=5))
         
         ax.set_xlabel('Concentración (mmol/L)')
         ax.set_ylabel('μ (h⁻¹)')
@@ -441,15 +461,221 @@ class InteractiveKineticModel:
         ax.grid(True, alpha=0.3)
         
         # Línea horizontal para 50% de inhibición
-        ax.axhline(y=self.parameters['mu_max'].get()*0.5, color='black', 
-                  linestyle='--', alpha=0.5, label='50% inhibición')
+        self.cmp_half_line = ax.axhline(y=0, color='black', 
+                                        linestyle='--', alpha=0.5, label='50% inhibición')
+        
+        self.blit_comparison = self.register_blit(
+            self.canvas_comparison,
+            [self.cmp_line1, self.cmp_line2, self.cmp_half_line] + cmp_scatters)
+        
+    def register_blit(self, canvas, artists):
+        """Registrar los artistas animados de una figura para redibujo por blitting"""
+        # La leyenda ya copió el estilo de los artistas, así que marcarlos
+        # como animados no la afecta
+        for artist in artists:
+            artist.set_animated(True)
+        
+        # Los datos experimentales se animan junto con las curvas para que,
+        # dibujando por zorder, sigan quedando por encima de ellas
+        blit_state = {
+            'canvas': canvas,
+            'artists': sorted(artists, key=lambda artist: artist.get_zorder()),
+            'axes': list(dict.fromkeys(artist.axes for artist in artists)),
+            'background': None
+        }
         
-        self.canvas_comparison.draw()
+        # Cada redibujo completo (inicial, cambio de tamaño o de límites)
+        # captura de nuevo el fondo estático
+        def on_draw(event):
+            blit_state['background'] = canvas.copy_from_bbox(canvas.figure.bbox)
+            self.draw_animated(blit_state)
+        
+        canvas.mpl_connect('draw_event', on_draw)
+        return blit_state
+    
+    def draw_animated(self, blit_state):
+        """Dibujar los artistas animados sobre el lienzo"""
+        figure = blit_state['canvas'].figure
+        for artist in blit_state['artists']:
+            figure.draw_artist(artist)
+    
+    def blit_figure(self, blit_state, full_redraw=False):
+        """Redibujar sólo los artistas animados sobre el fondo capturado"""
+        canvas = blit_state['canvas']
+        if full_redraw or blit_state['background'] is None:
+            # draw_event captura el fondo y dibuja los artistas animados
+            canvas.draw()
+            return
+        
+        canvas.restore_region(blit_state['background'])
+        self.draw_animated(blit_state)
+        
+        # Sólo se copian a Tk las regiones de los ejes con artistas animados
+        for ax in blit_state['axes']:
+            canvas.blit(ax.bbox)
+    
+    def rescale_axes(self, ax):
+        """Reajustar límites del eje; devuelve True si cambiaron"""
+        old_limits = (ax.get_xlim(), ax.get_ylim())
+        
+        ax.relim()
+        # Versiones antiguas de matplotlib no incluyen colecciones en relim
+        for collection in ax.collections:
+            ax.update_datalim(collection.get_offsets())
+        
+        if self._dragging:
+            self.grow_limits(ax)
+        else:
+            ax.autoscale_view()
+        
+        return (ax.get_xlim(), ax.get_ylim()) != old_limits
+        
+    def grow_limits(self, ax, headroom=0.2):
+        """Ampliar los límites sólo si los datos salen de la vista"""
+        # Con holgura (una fracción del rango o del propio valor, lo que sea
+        # mayor), para que un arrastre sostenido no obligue a un redibujo
+        # completo en cada paso
+        data_lim = ax.dataLim
+        if not np.all(np.isfinite(data_lim.get_points())):
+            return
+        
+        for get_lim, set_lim, data_min, data_max in (
+                (ax.get_xlim, ax.set_xlim, data_lim.x0, data_lim.x1),
+                (ax.get_ylim, ax.set_ylim, data_lim.y0, data_lim.y1)):
+            low, high = get_lim()
+            if data_min >= low and data_max <= high:
+                continue
+            
+            span = max(high, data_max) - min(low, data_min)
+            if data_min < low:
+                low = data_min - headroom * max(span, abs(data_min))
+            if data_max > high:
+                high = data_max + headroom * max(span, abs(data_max))
+            # auto=None conserva el autoescalado para el reajuste al soltar
+            set_lim(low, high, auto=None)
+        
+    def setup_results_panel(self, parent):
+        """Configurar panel de resultados"""
+        results_frame = ttk.LabelFrame(parent, text="Resultados y Análisis", padding=10)
+        results_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        
+        # Frame para resultados numéricos
+        numeric_frame = ttk.Frame(results_frame)
+        numeric_frame.pack(fill="x")
+        
+        # Variables para mostrar resultados
+        self.results_vars = {
+            'ed50_comp1': tk.StringVar(),
+            'ed50_comp2': tk.StringVar(),
+            'potencia_rel': tk.StringVar(),
+            'ki_ratio': tk.StringVar()
+        }
+        
+        # Crear etiquetas para resultados
+        for i, (key, var) in enumerate(self.results_vars.items()):
+            ttk.Label(numeric_frame, textvariable=var, 
+                     style="Param.TLabel").grid(row=0, column=i, padx=10, sticky="w")
+        
+        # Barra de estado para errores al actualizar gráficos
+        self.status_var = tk.StringVar()
+        ttk.Label(results_frame, textvariable=self.status_var,
+                 style="Status.TLabel").pack(fill="x", pady=(5, 0))
+        
+    def inhibition_model(self, concentration, mu_max, Ki):
+        """Modelo de inhibición competitiva"""
+        return mu_max / (1 + concentration / Ki)
+    
+    def get_parameter_values(self):
+        """Obtener los valores actuales de los parámetros como números de Python"""
+        return {key: var.get() for key, var in self.parameters.items()}
     
-    def update_results(self):
+    def calculate_kinetic_data(self, p):
+        """Calcular datos cinéticos integrados"""
+        # linspace fija exactamente n + 1 puntos con el extremo incluido;
+        # con arange el número dependía del redondeo de dt
+        n = int(p['time_points'])
+        if n != self._time_grid_points:
+            self._time_grid = np.linspace(0.0, 8.0, n + 1)
+            self._time_grid_points = n
+            self._kinetic_buffers = tuple(np.empty(self._time_grid.size) for _ in range(3))
+        time_array = self._time_grid
+        
+        # Usar Ki según el compuesto seleccionado
+        ki_value = (p['Ki_comp1'] if 
+                   self.selected_compound.get() == "compound1" else 
+                   p['Ki_comp2'])
+        
+        concentration, mu, log_biomass = self._kinetic_buffers
+        
+        _kinetic_kernel(
+            time_array,
+            p['initial_conc'],
+            p['ka'],
+            p['ke'],
+            p['mu_max'],
+            ki_value,
+            p['K_max'],
+            1e6,  # N0: población inicial (células/mL)
+            concentration, mu, log_biomass
+        )
+        
+        return SimpleNamespace(
+            time=time_array,
+            concentration=concentration,
+            mu=mu,
+            biomass=log_biomass
+        )
+    
+    def update_inhibition_plot(self, p):
+        """Actualizar gráfico de inhibición"""
+        mu_max = p['mu_max']
+        ki_values = [p['Ki_comp1'], p['Ki_comp2']]
+        
+        limits_changed = False
+        for ax, line, text, ki in zip(self.inh_axes, self.inh_lines, self.inh_texts, ki_values):
+            # Curva teórica
+            line.set_ydata(self.inhibition_model(self._conc_range, mu_max, ki))
+            
+            # Información de parámetros
+            ed50 = ki  # Para inhibición competitiva
+            text.set_text(f'Ki: {ki:.3f} mmol/L\nED50: {ed50:.3f} mmol/L')
+            
+            limits_changed |= self.rescale_axes(ax)
+        
+        self.blit_figure(self.blit_inhibition, full_redraw=limits_changed)
+    
+    def update_kinetic_plot(self, p):
+        """Actualizar gráfico de cinética integrada"""
+        kinetic_data = self.calculate_kinetic_data(p)
+        
+        self.kin_conc_line.set_data(kinetic_data.time, kinetic_data.concentration)
+        self.kin_mu_line.set_data(kinetic_data.time, kinetic_data.mu)
+        self.kin_bio_line.set_data(kinetic_data.time, kinetic_data.biomass)
+        
+        limits_changed = False
+        for ax in self.kin_axes:
+            limits_changed |= self.rescale_axes(ax)
+        
+        self.blit_figure(self.blit_kinetic, full_redraw=limits_changed)
+    
+    def update_comparison_plot(self, p):
+        """Actualizar gráfico de comparación"""
+        mu_max = p['mu_max']
+        
+        # Comparar ambos compuestos
+        self.cmp_line1.set_ydata(self.inhibition_model(self._conc_range, mu_max, p['Ki_comp1']))
+        self.cmp_line2.set_ydata(self.inhibition_model(self._conc_range, mu_max, p['Ki_comp2']))
+        
+        # Línea horizontal para 50% de inhibición
+        self.cmp_half_line.set_ydata([mu_max * 0.5, mu_max * 0.5])
+        
+        limits_changed = self.rescale_axes(self.cmp_ax)
+        self.blit_figure(self.blit_comparison, full_redraw=limits_changed)
+    
+    def update_results(self, p):
         """Actualizar panel de resultados"""
-        ki1 = self.parameters['Ki_comp1'].get()
-        ki2 = self.parameters['Ki_comp2'].get()
+        ki1 = p['Ki_comp1']
+        ki2 = p['Ki_comp2']
         
         potencia_rel = ki2 / ki1 if ki1 > 0 else 0
         
@@ -460,31 +686,97 @@ class InteractiveKineticModel:
     
     def update_plots(self):
         """Actualizar todos los gráficos"""
+        # Sólo se redibuja la pestaña visible; las demás quedan pendientes
+        # hasta que se seleccionen
+        self._last_values = self.get_parameter_values()
+        self._last_compound = self.selected_compound.get()
+        self.invalidate(*self._tab_keys)
+        self.refresh_plots()
+    
+    def invalidate(self, *keys):
+        """Marcar gráficos como pendientes de redibujo"""
+        for key in keys:
+            self._dirty[key] = True
+    
+    def refresh_plots(self):
+        """Redibujar la pestaña visible si tiene cambios pendientes"""
+        updaters = {
+            'inh': self.update_inhibition_plot,
+            'kin': self.update_kinetic_plot,
+            'cmp': self.update_comparison_plot
+        }
+        
         try:
-            self.update_inhibition_plot()
-            self.update_kinetic_plot()
-            self.update_comparison_plot()
-            self.update_results()
+            # Leer los parámetros de Tk una sola vez por redibujo
+            p = self.get_parameter_values()
+            
+            key = self._tab_keys[self.notebook.index(self.notebook.select())]
+            if self._dirty[key]:
+                updaters[key](p)
+                self._dirty[key] = False
+                if self._dragging:
+                    self._drag_plots.add(key)
+            self.update_results(p)
+            self.status_var.set("")
         except Exception as e:
-            messagebox.showerror("Error", f"Error al actualizar gráficos: {str(e)}")
+            # Sin ventanas modales: un valor transitorio durante el arrastre
+            # no debe bloquear la interfaz
+            self.status_var.set(f"⚠ Error al actualizar gráficos: {e}")
+            traceback.print_exc()
     
-    def on_parameter_change(self):
+    def on_parameter_change(self, name):
         """Callback para cambios en parámetros"""
-        # Actualización automática con un pequeño retraso para evitar demasiadas actualizaciones
-        if hasattr(self, '_update_timer'):
-            self.root.after_cancel(self._update_timer)
-        self._update_timer = self.root.after(100, self.update_plots)
+        value = self.parameters[name].get()
+        if value == self._last_values[name]:
+            return
+        self._last_values[name] = value
+        
+        # Sólo quedan pendientes los gráficos que dependen del parámetro
+        self.invalidate(*self._plot_dependencies[name])
+        
+        # Agrupar todos los cambios recibidos hasta que Tk quede inactivo
+        # en un único redibujo
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self.flush_redraw)
+    
+    def flush_redraw(self):
+        """Ejecutar el redibujo agrupado"""
+        self._redraw_pending = False
+        self.refresh_plots()
+    
+    def on_drag_start(self):
+        """Callback al empezar a arrastrar un control"""
+        self._dragging = True
+    
+    def on_drag_end(self):
+        """Callback al soltar un control: reajustar límites y redibujar"""
+        self._dragging = False
+        if self._drag_plots:
+            self.invalidate(*self._drag_plots)
+            self._drag_plots.clear()
+            self.refresh_plots()
     
     def on_compound_change(self):
         """Callback para cambio de compuesto"""
-        self.update_plots()
+        compound = self.selected_compound.get()
+        if compound == self._last_compound:
+            return
+        self._last_compound = compound
+        
+        # El compuesto seleccionado sólo afecta a la cinética integrada
+        self.invalidate('kin')
+        self.refresh_plots()
     
     def bind_events(self):
         """Vincular eventos"""
         # Actualizar gráficos cuando cambien los parámetros
-        for param in self.parameters.values():
+        for name, param in self.parameters.items():
             if isinstance(param, (tk.DoubleVar, tk.IntVar)):
-                param.trace("w", lambda *args: self.on_parameter_change())
+                param.trace("w", lambda *args, name=name: self.on_parameter_change(name))
+        
+        # Redibujar la pestaña recién seleccionada si quedó pendiente
+        self.notebook.bind("<<NotebookTabChanged>>", lambda event: self.refresh_plots())
     
     def reset_parameters(self):
         """Resetear parámetros a valores por defecto"""
@@ -509,9 +801,18 @@ class InteractiveKineticModel:
     def export_data(self):
         """Exportar datos actuales"""
         try:
-            kinetic_data = self.calculate_kinetic_data()
+            kinetic_data = self.calculate_kinetic_data(self.get_parameter_values())
             filename = f"kinetic_data_{self.selected_compound.get()}.csv"
-            kinetic_data.to_csv(filename, index=False)
+            
+            columns = np.column_stack([
+                kinetic_data.time,
+                kinetic_data.concentration,
+                kinetic_data.mu,
+                kinetic_data.biomass,
+                10.0 ** kinetic_data.biomass  # raw_biomass
+            ])
+            np.savetxt(filename, columns, delimiter=',', fmt='%.12g',
+                       header='time,concentration,mu,biomass,raw_biomass', comments='')
             messagebox.showinfo("Éxito", f"Datos exportados a {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Error al exportar datos: {str(e)}")